@@ -3,8 +3,23 @@
 Public exports are intentionally minimal; prefer importing submodules directly.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from . import core
-from .domain.orchestrator import run_survey_studio
+
+if TYPE_CHECKING:
+    from .domain.orchestrator import run_survey_studio
 
 __version__ = "0.1.0"
 __all__ = ["run_survey_studio", "core"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the orchestrator lazily so importing submodules does not load AutoGen."""
+    if name == "run_survey_studio":
+        from .domain.orchestrator import run_survey_studio  # noqa: PLC0415
+
+        return run_survey_studio
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,8 +9,12 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
-import uuid
+from secrets import token_hex
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 class ErrorSeverity(Enum):
@@ -40,7 +44,7 @@ class SurveyStudioError(Exception):
         self.severity = severity
         self.context = context or {}
         self.original_exception = original_exception
-        self.error_id = uuid.uuid4().hex[:8]
+        self.error_id = token_hex(4)
         self.timestamp = datetime.now().isoformat()
 
 
@@ -175,17 +179,9 @@ class OrchestrationError(SurveyStudioError):
         )
 
 
-def get_user_friendly_message(error: Exception) -> str:
-    """Get a user-friendly message for any exception.
-
-    Maps Survey Studio errors to their user_message attribute,
-    and provides generic messages for other exception types.
-    """
-    if isinstance(error, SurveyStudioError):
-        return error.user_message
-
-    # Map common Python exceptions to user-friendly messages
-    error_messages = {
+# Map common Python exceptions to user-friendly messages
+_EXCEPTION_MESSAGES: Mapping[type[Exception], str] = MappingProxyType(
+    {
         ConnectionError: (
             "Network connection failed. Please check your internet connection and try again."
         ),
@@ -195,14 +191,27 @@ def get_user_friendly_message(error: Exception) -> str:
         FileNotFoundError: "Required file not found. Please check your file paths.",
         PermissionError: "Permission denied. Please check your access rights.",
     }
+)
+
+_GENERIC_ERROR_MESSAGE = (
+    "An unexpected error occurred. Please try again or contact support if the problem persists."
+)
+
+
+def get_user_friendly_message(error: Exception) -> str:
+    """Get a user-friendly message for any exception.
+
+    Maps Survey Studio errors to their user_message attribute,
+    and provides generic messages for other exception types.
+    """
+    if isinstance(error, SurveyStudioError):
+        return error.user_message
 
-    for exc_type, message in error_messages.items():
+    for exc_type, message in _EXCEPTION_MESSAGES.items():
         if isinstance(error, exc_type):
             return message
 
-    return (
-        "An unexpected error occurred. Please try again or contact support if the problem persists."
-    )
+    return _GENERIC_ERROR_MESSAGE
 
 
 def get_error_details(error: Exception) -> dict[str, Any]:
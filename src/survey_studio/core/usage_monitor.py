@@ -2,21 +2,54 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from contextlib import suppress
+from dataclasses import dataclass, fields, replace
 from datetime import UTC, datetime
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any
+import shutil
+import textwrap
+import threading
+from typing import TYPE_CHECKING, Any
+import weakref
 
 from survey_studio.core.config import AIProvider
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 logger.propagate = False
 
-
-@dataclass
+# Number of buffered usage records written to disk in one batch
+USAGE_FLUSH_THRESHOLD = 64
+
+# Compact JSON separators for machine-read usage data
+_COMPACT_SEPARATORS = (",", ":")
+
+# (input, output) pricing in USD per 1M tokens (as of 2025)
+MODEL_PRICING: dict[tuple[AIProvider, str], tuple[float, float]] = {
+    (AIProvider.TOGETHER_AI, "meta-llama/Llama-3.1-8B-Instruct-Turbo"): (0.20, 0.20),
+    (AIProvider.TOGETHER_AI, "meta-llama/Llama-3.1-8B-Instruct"): (0.20, 0.20),
+    (AIProvider.TOGETHER_AI, "meta-llama/Llama-3.1-70B-Instruct-Turbo"): (0.90, 0.90),
+    (AIProvider.GEMINI, "gemini-2.5-flash"): (0.075, 0.30),
+    (AIProvider.GEMINI, "gemini-2.0-flash-exp"): (0.075, 0.30),
+    (AIProvider.GEMINI, "gemini-1.5-flash"): (0.075, 0.30),
+    (AIProvider.GEMINI, "gemini-1.5-pro"): (1.25, 5.00),
+    (AIProvider.PERPLEXITY, "llama-3.1-sonar-large-128k-online"): (1.00, 1.00),
+    (AIProvider.PERPLEXITY, "llama-3.1-sonar-small-128k-online"): (0.20, 0.20),
+    (AIProvider.PERPLEXITY, "llama-3.1-sonar-huge-128k-online"): (2.00, 2.00),
+    (AIProvider.OPENAI, "gpt-4o-mini"): (0.15, 0.60),
+    (AIProvider.OPENAI, "gpt-3.5-turbo"): (0.50, 1.50),
+    (AIProvider.OPENAI, "gpt-4o"): (2.50, 10.00),
+}
+DEFAULT_MODEL_PRICING: tuple[float, float] = (1.00, 1.00)
+
+
+@dataclass(slots=True)
 class UsageRecord:
     """Record of API usage for tracking and cost analysis."""
 
@@ -31,8 +64,27 @@ class UsageRecord:
     success: bool
     error_message: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict without dataclasses.asdict reflection."""
+        return {
+            "timestamp": self.timestamp,
+            "provider": self.provider,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "cost_usd": self.cost_usd,
+            "duration_ms": self.duration_ms,
+            "success": self.success,
+            "error_message": self.error_message,
+        }
 
-@dataclass
+
+# UsageRecord field names in constructor order, for positional construction on load
+_USAGE_RECORD_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(UsageRecord))
+
+
+@dataclass(slots=True)
 class ProviderStats:
     """Statistics for a specific provider."""
 
@@ -59,6 +111,33 @@ class UsageParams:
     error_message: str | None = None
 
 
+def _append_usage_records(data_dir: Path, usage_file: Path, records: list[UsageRecord]) -> None:
+    """Append buffered records to the JSON Lines file, clearing the buffer once written.
+
+    Records stay buffered when the write fails so they can be retried on the next flush.
+    """
+    if not records:
+        return
+
+    try:
+        lines = [json.dumps(record.to_dict(), separators=_COMPACT_SEPARATORS) for record in records]
+        # Ensure data directory exists
+        data_dir.mkdir(parents=True, exist_ok=True)
+        payload = ("\n".join(lines) + "\n").encode()
+        with open(usage_file, "ab+") as f:
+            # Terminate a partial last line so it cannot corrupt the first new record
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
+    except Exception as exc:
+        logger.error(f"Failed to save usage data: {exc}")
+        return
+
+    records.clear()
+
+
 class UsageMonitor:
     """Monitor and track AI provider usage and costs."""
 
@@ -70,35 +149,158 @@ class UsageMonitor:
         """
         super().__init__()
         self.data_dir = data_dir or Path.cwd()
-        self.usage_file = self.data_dir / "usage_data.json"
+        self.usage_file = self.data_dir / "usage_data.jsonl"
+        # Whole-file JSON array written by earlier releases, imported once on first load
+        self.legacy_usage_file = self.data_dir / "usage_data.json"
         self.stats_file = self.data_dir / "usage_stats.json"
-        self.usage_records: list[UsageRecord] = []
+        self._pending_records: list[UsageRecord] = []
+        # Running aggregates per provider, updated as records are added
+        self._provider_stats: dict[str, ProviderStats] = {}
+        self._duration_totals: dict[str, int] = {}
+        # Existing data is loaded on first read; recording only needs the append path
+        self._loaded = False
+        self._lock = threading.RLock()
+
+        # Write out buffered records when the monitor is collected or the interpreter exits,
+        # without the exit hook keeping the monitor alive
+        weakref.finalize(
+            self, _append_usage_records, self.data_dir, self.usage_file, self._pending_records
+        )
 
-        # Ensure data directory exists
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+    def _ensure_loaded(self) -> None:
+        """Load existing usage data on first access to the aggregated statistics."""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+            self._migrate_legacy_usage_data()
+            # Persist anything recorded before the first read so the load sees it
+            self.flush()
+            self._load_usage_data()
+            # Records still buffered after a failed flush are not in the file yet
+            for record in self._pending_records:
+                self._update_stats(record)
+            self._loaded = True
+
+    def _migrate_legacy_usage_data(self) -> None:
+        """Import history from the legacy usage_data.json into the JSON Lines file once."""
+        if not self.legacy_usage_file.exists():
+            return
+
+        legacy_name = self.legacy_usage_file.name
+        migrating_file = self.legacy_usage_file.with_name(f"{legacy_name}.migrating")
+        temp_file = self.usage_file.with_name(f"{self.usage_file.name}.tmp")
+        imported = False
+        try:
+            # Claim the legacy file first so a failure after the import cannot repeat it
+            self.legacy_usage_file.rename(migrating_file)
+            with open(migrating_file, "rb") as f:
+                legacy_records = json.load(f)
+
+            # Legacy records are older, so they go ahead of anything already appended
+            with open(temp_file, "wb") as out:
+                for data in legacy_records:
+                    out.write(json.dumps(data, separators=_COMPACT_SEPARATORS).encode() + b"\n")
+                if self.usage_file.exists():
+                    with open(self.usage_file, "rb") as current:
+                        shutil.copyfileobj(current, out)
+            temp_file.replace(self.usage_file)
+            imported = True
+            logger.info(f"Migrated {len(legacy_records)} usage records to {self.usage_file}")
+            migrating_file.rename(migrating_file.with_name(f"{legacy_name}.migrated"))
+        except Exception as exc:
+            logger.warning(f"Failed to migrate legacy usage data {self.legacy_usage_file}: {exc}")
+            temp_file.unlink(missing_ok=True)
+            # Hand an unimported file back so the next load retries it
+            if not imported and migrating_file.exists():
+                with suppress(OSError):
+                    migrating_file.rename(self.legacy_usage_file)
 
-        # Load existing data
-        self._load_usage_data()
+    def _iter_stored_records(self, end_offset: int | None = None) -> Iterator[dict[str, Any]]:
+        """Yield stored usage records one line at a time, skipping undecodable lines.
+
+        Args:
+            end_offset: Byte offset to stop reading at. Defaults to the end of the file.
+        """
+        if not self.usage_file.exists():
+            return
+
+        with open(self.usage_file, "rb") as f:
+            position = 0
+            for line_number, line in enumerate(f, start=1):
+                position += len(line)
+                # Lines past the offset were appended after the caller's snapshot
+                if end_offset is not None and position > end_offset:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError as exc:
+                    # Typically a partial last line left by an interrupted append
+                    logger.warning(f"Skipping unreadable usage record on line {line_number}: {exc}")
+                    continue
+                yield data
 
     def _load_usage_data(self) -> None:
-        """Load existing usage data from file."""
+        """Rebuild provider statistics by streaming the JSON Lines file."""
+        self._provider_stats = {}
+        self._duration_totals = {}
         try:
-            if self.usage_file.exists():
-                with open(self.usage_file) as f:
-                    self.usage_records = [UsageRecord(**record) for record in json.load(f)]
-            else:
-                self.usage_records = []
-        except Exception as exc:
+            for data in self._iter_stored_records():
+                try:
+                    record = UsageRecord(*map(data.get, _USAGE_RECORD_FIELDS))
+                    self._update_stats(record)
+                except (AttributeError, TypeError) as exc:
+                    logger.warning(f"Skipping malformed usage record: {exc}")
+        except OSError as exc:
             logger.warning(f"Failed to load usage data: {exc}")
-            self.usage_records = []
+            self._provider_stats = {}
+            self._duration_totals = {}
+
+    def _update_stats(self, record: UsageRecord) -> None:
+        """Fold a single usage record into the running provider statistics."""
+        stats = self._provider_stats.get(record.provider)
+        if stats is None:
+            stats = ProviderStats(
+                provider=record.provider,
+                total_requests=0,
+                successful_requests=0,
+                failed_requests=0,
+                total_tokens=0,
+                total_cost_usd=0.0,
+                avg_duration_ms=0.0,
+            )
+
+        # Compute every new value first so a malformed record leaves the stats untouched
+        total_tokens = stats.total_tokens + record.total_tokens
+        total_cost_usd = stats.total_cost_usd + record.cost_usd
+        duration_total = self._duration_totals.get(record.provider, 0) + record.duration_ms
+        is_latest = not stats.last_used or record.timestamp > stats.last_used
+
+        self._provider_stats[record.provider] = stats
+        self._duration_totals[record.provider] = duration_total
+        stats.total_requests += 1
+        stats.total_tokens = total_tokens
+        stats.total_cost_usd = total_cost_usd
+
+        if record.success:
+            stats.successful_requests += 1
+        else:
+            stats.failed_requests += 1
 
-    def _save_usage_data(self) -> None:
-        """Save usage data to file."""
-        try:
-            with open(self.usage_file, "w") as f:
-                json.dump([asdict(record) for record in self.usage_records], f, indent=2)
-        except Exception as exc:
-            logger.error(f"Failed to save usage data: {exc}")
+        # Update last used timestamp
+        if is_latest:
+            stats.last_used = record.timestamp
+
+        stats.avg_duration_ms = duration_total / stats.total_requests
+
+    def flush(self) -> None:
+        """Append all buffered usage records to the JSON Lines file."""
+        with self._lock:
+            _append_usage_records(self.data_dir, self.usage_file, self._pending_records)
 
     def record_usage(self, params: UsageParams) -> None:
         """Record API usage for tracking and cost analysis.
@@ -106,14 +308,15 @@ class UsageMonitor:
         Args:
             params: Usage parameters containing all necessary data
         """
+        provider_value = params.provider.value
         total_tokens = params.input_tokens + params.output_tokens
         cost_usd = self._calculate_cost(
             params.provider, params.model, params.input_tokens, params.output_tokens
         )
 
         record = UsageRecord(
-            timestamp=datetime.now(UTC).isoformat(),
-            provider=params.provider.value,
+            timestamp=datetime.now(UTC).isoformat(timespec="milliseconds"),
+            provider=provider_value,
             model=params.model,
             input_tokens=params.input_tokens,
             output_tokens=params.output_tokens,
@@ -124,18 +327,24 @@ class UsageMonitor:
             error_message=params.error_message,
         )
 
-        self.usage_records.append(record)
-        self._save_usage_data()
+        with self._lock:
+            if self._loaded:
+                self._update_stats(record)
+            self._pending_records.append(record)
+            should_flush = len(self._pending_records) >= USAGE_FLUSH_THRESHOLD
+
+        if should_flush:
+            self.flush()
 
         message = (
-            f"Recorded usage: {params.provider.value}/{params.model} - "
+            f"Recorded usage: {provider_value}/{params.model} - "
             f"{total_tokens} tokens, ${cost_usd:.4f}"
         )
         logger.info(
             message,
             extra={
                 "extra_fields": {
-                    "provider": params.provider.value,
+                    "provider": provider_value,
                     "model": params.model,
                     "tokens": total_tokens,
                     "cost": cost_usd,
@@ -144,8 +353,9 @@ class UsageMonitor:
             },
         )
 
+    @staticmethod
     def _calculate_cost(
-        self, provider: AIProvider, model: str, input_tokens: int, output_tokens: int
+        provider: AIProvider, model: str, input_tokens: int, output_tokens: int
     ) -> float:
         """Calculate cost based on provider and model pricing.
 
@@ -158,40 +368,8 @@ class UsageMonitor:
         Returns:
             Estimated cost in USD
         """
-        # Pricing per 1M tokens (as of 2025)
-        pricing = {
-            AIProvider.TOGETHER_AI: {
-                "meta-llama/Llama-3.1-8B-Instruct-Turbo": {"input": 0.20, "output": 0.20},
-                "meta-llama/Llama-3.1-8B-Instruct": {"input": 0.20, "output": 0.20},
-                "meta-llama/Llama-3.1-70B-Instruct-Turbo": {"input": 0.90, "output": 0.90},
-            },
-            AIProvider.GEMINI: {
-                "gemini-2.5-flash": {"input": 0.075, "output": 0.30},
-                "gemini-2.0-flash-exp": {"input": 0.075, "output": 0.30},
-                "gemini-1.5-flash": {"input": 0.075, "output": 0.30},
-                "gemini-1.5-pro": {"input": 1.25, "output": 5.00},
-            },
-            AIProvider.PERPLEXITY: {
-                "llama-3.1-sonar-large-128k-online": {"input": 1.00, "output": 1.00},
-                "llama-3.1-sonar-small-128k-online": {"input": 0.20, "output": 0.20},
-                "llama-3.1-sonar-huge-128k-online": {"input": 2.00, "output": 2.00},
-            },
-            AIProvider.OPENAI: {
-                "gpt-4o-mini": {"input": 0.15, "output": 0.60},
-                "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
-                "gpt-4o": {"input": 2.50, "output": 10.00},
-            },
-        }
-
-        provider_pricing = pricing.get(provider, {})
-        model_pricing = provider_pricing.get(
-            model, {"input": 1.00, "output": 1.00}
-        )  # Default fallback
-
-        input_cost = (input_tokens / 1_000_000) * model_pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * model_pricing["output"]
-
-        return input_cost + output_cost
+        input_price, output_price = MODEL_PRICING.get((provider, model), DEFAULT_MODEL_PRICING)
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
 
     def get_provider_stats(self, provider: AIProvider | None = None) -> list[ProviderStats]:
         """Get usage statistics for providers.
@@ -202,46 +380,14 @@ class UsageMonitor:
         Returns:
             List of provider statistics
         """
-        if provider:
-            records = [r for r in self.usage_records if r.provider == provider.value]
-        else:
-            records = self.usage_records
-
-        stats_by_provider: dict[str, ProviderStats] = {}
-
-        for record in records:
-            if record.provider not in stats_by_provider:
-                stats_by_provider[record.provider] = ProviderStats(
-                    provider=record.provider,
-                    total_requests=0,
-                    successful_requests=0,
-                    failed_requests=0,
-                    total_tokens=0,
-                    total_cost_usd=0.0,
-                    avg_duration_ms=0.0,
-                )
-
-            stats = stats_by_provider[record.provider]
-            stats.total_requests += 1
-            stats.total_tokens += record.total_tokens
-            stats.total_cost_usd += record.cost_usd
-
-            if record.success:
-                stats.successful_requests += 1
-            else:
-                stats.failed_requests += 1
-
-            # Update last used timestamp
-            if not stats.last_used or record.timestamp > stats.last_used:
-                stats.last_used = record.timestamp
-
-        # Calculate averages
-        for stats in stats_by_provider.values():
-            if stats.total_requests > 0:
-                durations = [r.duration_ms for r in records if r.provider == stats.provider]
-                stats.avg_duration_ms = sum(durations) / len(durations)
-
-        return list(stats_by_provider.values())
+        self._ensure_loaded()
+        # Copy under the lock so a concurrent record_usage cannot be observed half-applied
+        with self._lock:
+            if provider:
+                stats = self._provider_stats.get(provider.value)
+                return [replace(stats)] if stats else []
+
+            return [replace(stats) for stats in self._provider_stats.values()]
 
     def get_total_usage(self) -> dict[str, Any]:
         """Get total usage statistics across all providers.
@@ -249,44 +395,75 @@ class UsageMonitor:
         Returns:
             Dictionary with total usage statistics
         """
-        if not self.usage_records:
-            return {
-                "total_requests": 0,
-                "successful_requests": 0,
-                "failed_requests": 0,
-                "total_tokens": 0,
-                "total_cost_usd": 0.0,
-                "avg_duration_ms": 0.0,
-            }
-
-        total_requests = len(self.usage_records)
-        successful_requests = sum(1 for r in self.usage_records if r.success)
-        failed_requests = total_requests - successful_requests
-        total_tokens = sum(r.total_tokens for r in self.usage_records)
-        total_cost = sum(r.cost_usd for r in self.usage_records)
-        avg_duration = sum(r.duration_ms for r in self.usage_records) / total_requests
+        self._ensure_loaded()
+        total_requests = successful_requests = total_tokens = total_duration = 0
+        total_cost = 0.0
+        with self._lock:
+            for stats in self._provider_stats.values():
+                total_requests += stats.total_requests
+                successful_requests += stats.successful_requests
+                total_tokens += stats.total_tokens
+                total_cost += stats.total_cost_usd
+                total_duration += self._duration_totals[stats.provider]
 
         return {
             "total_requests": total_requests,
             "successful_requests": successful_requests,
-            "failed_requests": failed_requests,
+            "failed_requests": total_requests - successful_requests,
             "total_tokens": total_tokens,
             "total_cost_usd": total_cost,
-            "avg_duration_ms": avg_duration,
+            "avg_duration_ms": total_duration / total_requests if total_requests else 0.0,
         }
 
-    def export_usage_data(self, file_path: Path) -> None:
+    def export_usage_data(self, file_path: Path, pretty: bool = False) -> None:
         """Export usage data to a file.
 
         Args:
             file_path: Path to export the data to
+            pretty: Indent the exported JSON for human reading
+
+        Raises:
+            ValueError: If file_path is the monitor's own usage file
         """
+        # The live file is read while exporting, and the legacy file would be re-imported
+        reserved_paths = {self.usage_file.resolve(), self.legacy_usage_file.resolve()}
+        if file_path.resolve() in reserved_paths:
+            raise ValueError(f"Cannot export usage data over the monitor's own file {file_path}")
+
+        # Loading first imports any legacy usage_data.json history into the live file
+        self._ensure_loaded()
+
+        # Stream into a temporary file so a failed export never leaves a partial file behind
+        temp_path = file_path.with_name(f"{file_path.name}.tmp")
         try:
-            with open(file_path, "w") as f:
-                json.dump([asdict(record) for record in self.usage_records], f, indent=2)
+            # The file is append-only, so a size taken after flushing marks a stable snapshot
+            # that can be streamed without blocking concurrent record_usage calls
+            with self._lock:
+                self.flush()
+                end_offset = self.usage_file.stat().st_size if self.usage_file.exists() else 0
+
+            with open(temp_path, "w") as out:
+                wrote_records = False
+                for data in self._iter_stored_records(end_offset):
+                    if pretty:
+                        item = "\n" + textwrap.indent(json.dumps(data, indent=2), "  ")
+                    else:
+                        item = json.dumps(data, separators=_COMPACT_SEPARATORS)
+                    out.write("," if wrote_records else "[")
+                    out.write(item)
+                    wrote_records = True
+
+                if not wrote_records:
+                    out.write("[]")
+                elif pretty:
+                    out.write("\n]")
+                else:
+                    out.write("]")
+            temp_path.replace(file_path)
             logger.info(f"Usage data exported to {file_path}")
         except Exception as exc:
             logger.error(f"Failed to export usage data: {exc}")
+            temp_path.unlink(missing_ok=True)
             raise
 
 
@@ -294,12 +471,15 @@ class UsageMonitorSingleton:
     """Singleton wrapper for UsageMonitor to avoid global variables."""
 
     _instance: UsageMonitor | None = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> UsageMonitor:
         """Get the singleton usage monitor instance."""
         if cls._instance is None:
-            cls._instance = UsageMonitor()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = UsageMonitor()
         return cls._instance
 
 
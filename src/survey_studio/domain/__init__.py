@@ -1,5 +1,19 @@
 """Business logic and orchestration for Survey Studio."""
 
-from .orchestrator import run_survey_studio
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .orchestrator import run_survey_studio
 
 __all__ = ["run_survey_studio"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the orchestrator lazily so importing domain submodules does not load AutoGen."""
+    if name == "run_survey_studio":
+        from .orchestrator import run_survey_studio  # noqa: PLC0415
+
+        return run_survey_studio
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,27 +3,60 @@
 from __future__ import annotations
 
 import datetime
+from functools import lru_cache
 import os
 import re
+import time
 
 from survey_studio.core.errors import ValidationError
 
-ALLOWED_MODELS: tuple[str, ...] = ("gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo")
+ALLOWED_MODELS: frozenset[str] = frozenset({"gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo"})
 MAX_TOPIC_LENGTH: int = 200
 MIN_TOPIC_LENGTH: int = 3
 MAX_NUM_PAPERS: int = 10
 MAX_KEYWORDS: int = 10
 MIN_YEAR: int = 1900
 
+# Allow alphanumeric, spaces, common punctuation, and unicode letters.
+# A single character class with fullmatch scans the input once without backtracking.
+_TOPIC_RE = re.compile(r'[\w\s.,!?\-:;()\[\]\'"]+')
+# Allow alphanumeric, spaces, hyphens and underscores in keywords
+_KEYWORD_RE = re.compile(r"[a-zA-Z0-9\s_-]+")
+# Same character set plus the comma separator, checked over the whole input at once
+_KEYWORDS_INPUT_RE = re.compile(r"[a-zA-Z0-9\s_,-]*")
+# OpenAI key body after the "sk-" prefix
+_API_KEY_BODY_RE = re.compile(r"^[a-zA-Z0-9_-]{20,}$")
+
+# Characters stripped by sanitize_text: injection-prone symbols plus ASCII control characters
+_DANGEROUS_CHARS: frozenset[str] = frozenset("<>&\"'\\`$|;{}")
+_CONTROL_CHARS: frozenset[str] = frozenset(map(chr, [*range(32), 0x7F]))
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(_DANGEROUS_CHARS | _CONTROL_CHARS))
+
+
+# How long the cached current year is reused before the clock is read again
+YEAR_CACHE_SECONDS: int = 3600
+
+
+@lru_cache(maxsize=1)
+def _year_for_bucket(_bucket: int) -> int:
+    return datetime.datetime.now().year
+
+
+def _current_year() -> int:
+    """Return the current year, reading the wall clock at most once per hour."""
+    return _year_for_bucket(int(time.monotonic()) // YEAR_CACHE_SECONDS)
+
 
 def validate_topic(topic: str) -> str:
     topic = topic.strip()
-    if not topic:
+    topic_length = len(topic)
+    if not topic_length:
         raise ValidationError("topic must be a non-empty string")
-    if len(topic) < MIN_TOPIC_LENGTH:
+    if topic_length < MIN_TOPIC_LENGTH:
         raise ValidationError(f"topic must be at least {MIN_TOPIC_LENGTH} characters long")
-    if len(topic) > MAX_TOPIC_LENGTH:
+    if topic_length > MAX_TOPIC_LENGTH:
         raise ValidationError("topic is too long; please shorten to <= 200 chars")
+    # Length is bounded above, so the character scan is O(MAX_TOPIC_LENGTH)
     if not validate_topic_characters(topic):
         raise ValidationError(
             "topic contains invalid characters; use only alphanumeric, spaces, "
@@ -42,7 +75,7 @@ def validate_num_papers(num_papers: int) -> int:
 
 def validate_model(model: str) -> str:
     if model not in ALLOWED_MODELS:
-        raise ValidationError(f"model must be one of: {', '.join(ALLOWED_MODELS)}")
+        raise ValidationError(f"model must be one of: {', '.join(sorted(ALLOWED_MODELS))}")
     return model
 
 
@@ -62,29 +95,13 @@ def sanitize_text(text: str) -> str:
     collapsed = " ".join(text.split())
 
     # Remove potentially dangerous characters while preserving readability
-    sanitized: list[str] = []
-    control_charachter_ord = 32  # noqa: N806
-    dangerous_chars: list[str] = [  # noqa: N806
-        "<",
-        ">",
-        "&",
-        '"',
-        "'",
-        "\\",
-        "`",
-        "$",
-        "|",
-        ";",
-        "{",
-        "}",
-    ]
-
-    for ch in collapsed:
-        # Allow printable characters but filter out dangerous ones
-        if ch.isprintable() and ord(ch) >= control_charachter_ord and ch not in dangerous_chars:
-            sanitized.append(ch)
-
-    return "".join(sanitized)
+    sanitized = collapsed.translate(_SANITIZE_TABLE)
+
+    # Rare slow path: drop any remaining non-printable (e.g. unicode format) characters
+    if not sanitized.isprintable():
+        sanitized = "".join(ch for ch in sanitized if ch.isprintable())
+
+    return sanitized
 
 
 def clamp(value: int, min_value: int, max_value: int) -> int:
@@ -93,10 +110,8 @@ def clamp(value: int, min_value: int, max_value: int) -> int:
 
 def validate_topic_characters(topic: str) -> bool:
     """Validate that topic contains only sane characters."""
-    # Allow alphanumeric, spaces, common punctuation, and unicode letters
     # Reject characters that could cause injection issues
-    pattern = r'^[\w\s.,!?\-:\;\(\)\[\]\'"]+$'
-    return bool(re.match(pattern, topic, re.UNICODE))
+    return bool(_TOPIC_RE.fullmatch(topic))
 
 
 def validate_keywords(keywords_str: str) -> list[str]:
@@ -104,30 +119,27 @@ def validate_keywords(keywords_str: str) -> list[str]:
     if not keywords_str.strip():
         return []
 
-    # Split by comma and clean up
-    keywords = [kw.strip() for kw in keywords_str.split(",") if kw.strip()]
-
-    # Remove empty entries
-    keywords = [kw for kw in keywords if kw]
+    # Split by comma, strip each entry once and drop empty ones
+    keywords = [kw for kw in (part.strip() for part in keywords_str.split(",")) if kw]
 
     if len(keywords) > MAX_KEYWORDS:
         raise ValidationError(f"Too many keywords; maximum is {MAX_KEYWORDS}")
 
-    # Validate each keyword format (allow spaces for multi-word keywords)
-    for keyword in keywords:
-        # Check for invalid characters explicitly
-        if any(char in keyword for char in "@#&!") or not re.match(r"^[a-zA-Z0-9\s_-]+$", keyword):
-            raise ValidationError(
-                f"Invalid keyword '{keyword}'; use only alphanumeric characters, "
-                + "spaces, hyphens, and underscores"
-            )
+    # Validate every keyword's characters in one scan (allow spaces for multi-word keywords)
+    if not _KEYWORDS_INPUT_RE.fullmatch(keywords_str):
+        # Slow path, only on failure: report the first offending keyword
+        keyword = next(kw for kw in keywords if not _KEYWORD_RE.fullmatch(kw))
+        raise ValidationError(
+            f"Invalid keyword '{keyword}'; use only alphanumeric characters, "
+            + "spaces, hyphens, and underscores"
+        )
 
     return keywords
 
 
 def validate_year_range(start_year: int, end_year: int) -> tuple[int, int]:
     """Validate year range for literature search."""
-    current_year = datetime.datetime.now().year
+    current_year = _current_year()
 
     if start_year < MIN_YEAR:
         raise ValidationError(f"Start year must be >= {MIN_YEAR}")
@@ -151,4 +163,4 @@ def validate_api_key_format(api_key: str) -> bool:
     key_body = api_key[3:]
 
     # Should be alphanumeric with possible underscores/hyphens
-    return bool(re.match(r"^[a-zA-Z0-9_-]{20,}$", key_body))
+    return bool(_API_KEY_BODY_RE.match(key_body))